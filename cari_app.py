@@ -5,7 +5,10 @@
 # Çalıştır:
 #   python cari_app.py
 
+import functools
 import sqlite3
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, date
 
@@ -36,59 +39,87 @@ CREATE TABLE IF NOT EXISTS transactions (
     iscilik_doviz TEXT,                -- USD / EUR / TL (opsiyon)
     birim_fiyat_veya_nakit REAL DEFAULT 0
 );
+-- müşteri ekstresi (WHERE musteri=? ORDER BY tarih, id) ve DISTINCT musteri için
+CREATE INDEX IF NOT EXISTS idx_tx_musteri_tarih ON transactions(musteri, tarih, id);
 """
 
-def db_connect():
-    con = sqlite3.connect(DB_PATH)
+_CON = None
+
+def db_open(check_same_thread: bool = True):
+    con = sqlite3.connect(DB_PATH, check_same_thread=check_same_thread)
     con.row_factory = sqlite3.Row
+    # WAL ile NORMAL yeterince güvenli; her commit'te fsync yapılmaz
+    con.execute("PRAGMA synchronous=NORMAL")
     return con
 
+def db_connect():
+    # Tek, uzun ömürlü bağlantı: her çağrıda yeniden açıp PRAGMA/cache kurmayalım
+    global _CON
+    if _CON is None:
+        _CON = db_open(check_same_thread=False)
+    return _CON
+
 def db_init():
-    with db_connect() as con:
+    con = db_connect()
+    con.execute("PRAGMA journal_mode=WAL")  # kalıcı, dosyaya yazılır
+    con.execute("PRAGMA cache_size=-20000")  # ~20 MB sayfa önbelleği
+    with con:
         con.executescript(SCHEMA)
 
-def db_insert_many(rows: list[dict]):
-    with db_connect() as con:
-        con.executemany(
-            """
-            INSERT INTO transactions
-            (tarih, musteri, aciklama, islem_turu, ayar, gram, birim, iscilik_doviz, birim_fiyat_veya_nakit)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    r["tarih"],
-                    r["musteri"],
-                    r.get("aciklama", ""),
-                    r["islem_turu"],
-                    r.get("ayar", ""),
-                    float(r.get("gram", 0) or 0),
-                    r.get("birim", "gr"),
-                    (r.get("iscilik_doviz", None) or None),
-                    float(r.get("birim_fiyat_veya_nakit", 0) or 0),
-                )
-                for r in rows
-            ],
-        )
+_INSERT_COLS = (
+    "tarih", "musteri", "aciklama", "islem_turu", "ayar", "gram", "birim", "iscilik_doviz", "birim_fiyat_veya_nakit",
+)
+_INSERT_SQL = f"""
+INSERT INTO transactions
+({", ".join(_INSERT_COLS)})
+VALUES ({", ".join("?" * len(_INSERT_COLS))})
+"""
 
-def db_list_customers() -> list[str]:
-    with db_connect() as con:
-        cur = con.execute("SELECT DISTINCT musteri FROM transactions ORDER BY musteri")
-        return [r["musteri"] for r in cur.fetchall()]
-
-def db_get_transactions(musteri: str) -> list[dict]:
-    with db_connect() as con:
-        cur = con.execute(
-            "SELECT * FROM transactions WHERE musteri=? ORDER BY tarih, id",
-            (musteri,),
-        )
-        return [dict(r) for r in cur.fetchall()]
+def _insert_params(r: dict) -> tuple:
+    return (
+        r["tarih"],
+        r["musteri"],
+        r.get("aciklama", ""),
+        r["islem_turu"],
+        r.get("ayar", ""),
+        float(r.get("gram", 0) or 0),
+        r.get("birim", "gr"),
+        (r.get("iscilik_doviz", None) or None),
+        float(r.get("birim_fiyat_veya_nakit", 0) or 0),
+    )
+
+def db_insert_many(rows: list[dict], con=None):
+    # con: arka plan thread'i kendi bağlantısını verir (bkz. App.import_excel)
+    con = con or db_connect()
+    with con:
+        # tek transaction: tüm satırlar tek commit ile yazılır
+        con.execute("BEGIN")
+        con.executemany(_INSERT_SQL, (_insert_params(r) for r in rows))
 
-def db_add_transaction(r: dict):
-    db_insert_many([r])
+def db_list_customers() -> list[str]:
+    cur = db_connect().execute("SELECT DISTINCT musteri FROM transactions ORDER BY musteri")
+    return [r["musteri"] for r in cur.fetchall()]
+
+def db_get_transactions(musteri: str) -> list[sqlite3.Row]:
+    cur = db_connect().execute(
+        "SELECT * FROM transactions WHERE musteri=? ORDER BY tarih, id",
+        (musteri,),
+    )
+    # Row, tx["kolon"] erişimini destekler; dict'e kopyalamaya gerek yok
+    return cur.fetchall()
+
+def db_count_transactions(musteri: str) -> int:
+    cur = db_connect().execute("SELECT COUNT(*) FROM transactions WHERE musteri=?", (musteri,))
+    return cur.fetchone()[0]
+
+def db_add_transaction(r: dict) -> int:
+    con = db_connect()
+    with con:
+        return con.execute(_INSERT_SQL, _insert_params(r)).lastrowid
 
 def db_delete_transaction(tx_id: int):
-    with db_connect() as con:
+    con = db_connect()
+    with con:
         con.execute("DELETE FROM transactions WHERE id=?", (tx_id,))
 
 
@@ -103,6 +134,16 @@ def _to_iso_date(v) -> str:
     if isinstance(v, date):
         return v.isoformat()
     s = str(v).strip()
+    # Sık görülen şekiller için strptime (ve başarısız denemelerin exception'ları) atlanır
+    # int() boşluk, işaret, "_" ve ASCII olmayan rakamları da kabul eder; onları strptime'a bırak
+    if len(s) == 10 and s.isascii():
+        try:
+            if s[4] == "-" and s[7] == "-" and (s[0:4] + s[5:7] + s[8:10]).isdigit():
+                return date.fromisoformat(s).isoformat()
+            if s[2] in "./" and s[5] == s[2] and (s[0:2] + s[3:5] + s[6:10]).isdigit():
+                return date(int(s[6:10]), int(s[3:5]), int(s[0:2])).isoformat()
+        except ValueError:
+            pass
     for fmt in ("%d.%m.%Y", "%d/%m/%Y", "%Y-%m-%d"):
         try:
             return datetime.strptime(s, fmt).date().isoformat()
@@ -111,89 +152,87 @@ def _to_iso_date(v) -> str:
     return date.today().isoformat()
 
 def import_from_excel(path: str) -> list[dict]:
-    wb = openpyxl.load_workbook(path, data_only=True)
-
-    if "CARİ HAREKETLER" not in wb.sheetnames:
-        raise ValueError("Excel içinde 'CARİ HAREKETLER' sayfası bulunamadı.")
-
-    ws = wb["CARİ HAREKETLER"]
-
-    # Beklenen kolonlar (sende bu şekildeydi):
-    # A:Tarih B:Müşteri C:Açıklama D:İşlem Türü E:Ayar F:Gram G:Birim H:İşçilik Döviz I:İşçilik Birim Fiyat / Alınan Nakit
-    rows = []
-    for r in range(2, ws.max_row + 1):
-        musteri = ws.cell(r, 2).value
-        if not musteri:
-            continue
-        rows.append(
-            {
-                "tarih": _to_iso_date(ws.cell(r, 1).value),
-                "musteri": str(musteri).strip(),
-                "aciklama": str(ws.cell(r, 3).value or "").strip(),
-                "islem_turu": str(ws.cell(r, 4).value or "").strip(),
-                "ayar": str(ws.cell(r, 5).value or "").strip(),
-                "gram": ws.cell(r, 6).value or 0,
-                "birim": str(ws.cell(r, 7).value or "gr").strip(),
-                "iscilik_doviz": str(ws.cell(r, 8).value or "").strip(),
-                "birim_fiyat_veya_nakit": ws.cell(r, 9).value or 0,
-            }
-        )
-    return rows
+    # read_only: sayfayı belleğe almadan satır satır okur (büyük dosyalarda çok daha hızlı)
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    try:
+        if "CARİ HAREKETLER" not in wb.sheetnames:
+            raise ValueError("Excel içinde 'CARİ HAREKETLER' sayfası bulunamadı.")
+
+        ws = wb["CARİ HAREKETLER"]
+        # read_only modda okuma kayıtlı <dimension> ile sınırlanır; bazı araçlar bunu yanlış yazar
+        ws.reset_dimensions()
+
+        # Beklenen kolonlar (sende bu şekildeydi):
+        # A:Tarih B:Müşteri C:Açıklama D:İşlem Türü E:Ayar F:Gram G:Birim H:İşçilik Döviz I:İşçilik Birim Fiyat / Alınan Nakit
+        rows = []
+        # max_col=9: fazladan kolonlar okunmaz, kısa satırlar None ile tamamlanır
+        for row_vals in ws.iter_rows(min_row=2, max_col=9, values_only=True):
+            tarih_v, musteri_v, aciklama_v, islem_v, ayar_v, gram_v, birim_v, doviz_v, bf_v = row_vals
+            if not musteri_v:
+                continue
+            rows.append(
+                {
+                    "tarih": _to_iso_date(tarih_v),
+                    "musteri": str(musteri_v).strip(),
+                    "aciklama": str(aciklama_v or "").strip(),
+                    "islem_turu": str(islem_v or "").strip(),
+                    "ayar": str(ayar_v or "").strip(),
+                    "gram": gram_v or 0,
+                    "birim": str(birim_v or "gr").strip(),
+                    "iscilik_doviz": str(doviz_v or "").strip(),
+                    "birim_fiyat_veya_nakit": bf_v or 0,
+                }
+            )
+        return rows
+    finally:
+        # read_only modda dosya açık kalır; hata olsa da kapat
+        wb.close()
 
 
 # =========================
 # Hesaplama (Excel mantığı)
 # =========================
-def ayar_katsayi(ayar: str) -> float:
-    if not ayar:
-        return 0.0
-    a = str(ayar).strip().lower()
-    if a == "has":
-        return 1.0
-    if a in ("925", "0.925"):
-        return 0.925
-    if a in ("935", "0.935"):
-        return 0.935
-    return 0.0
-
-def sign_has_gram(islem_turu: str) -> int:
-    # Satış/Ödeme + ; Alış/Tahsilat -
-    t = (islem_turu or "").strip().lower()
-    return 1 if t in ("satış", "satis", "ödeme", "odeme") else -1
-
-def sign_iscilik_tutar(islem_turu: str) -> int:
-    # Satış: + ; Alış: - ; Ödeme: + ; Tahsilat: -
-    t = (islem_turu or "").strip().lower()
-    if t in ("satış", "satis"):
-        return 1
-    if t in ("alış", "alis"):
-        return -1
-    if t in ("ödeme", "odeme"):
-        return 1
-    return -1
-
-def compute_running(transactions: list[dict]) -> list[dict]:
-    bakiye_has = 0.0
-    bakiye_usd = 0.0
-    bakiye_eur = 0.0
-    bakiye_tl = 0.0
+# Normalize edilmiş (strip + lower) değerler için tablolar
+_AYAR = {"has": 1.0, "925": 0.925, "0.925": 0.925, "935": 0.935, "0.935": 0.935}
+# Has gram ve işçilik tutarı için aynı işaret: Satış/Ödeme + ; Alış/Tahsilat (ve diğerleri) -
+_SIGN = {"satış": 1, "satis": 1, "ödeme": 1, "odeme": 1, "alış": -1, "alis": -1, "tahsilat": -1}
+# Satış/Alış: gram * i ; Ödeme/Tahsilat: i
+_IS_GRAM_OP = frozenset({"satış", "satis", "alış", "alis"})
+
+# Girdi çeşidi çok az (birkaç ayar / işlem türü); normalize + tablo sonucu önbelleklenir
+@functools.lru_cache(maxsize=32)
+def _ayar_k(ayar) -> float:
+    return _AYAR.get(str(ayar).strip().lower(), 0.0)
+
+@functools.lru_cache(maxsize=32)
+def _islem_k(islem_turu: str) -> tuple:
+    # -> (işaret, gram işlemi mi)
+    t = islem_turu.strip().lower()
+    return _SIGN.get(t, -1), t in _IS_GRAM_OP
+
+def compute_running(transactions: list, start: dict = None) -> list[dict]:
+    # transactions: sqlite3.Row veya aynı anahtarlara sahip dict'ler
+    # start: önceki son satır; verilirse bakiyeler onun üstüne eklenir (sona ekleme için)
+    if start is not None:
+        bakiye_has = start["bakiye_has"]
+        bakiye_usd = start["bakiye_usd"]
+        bakiye_eur = start["bakiye_eur"]
+        bakiye_tl = start["bakiye_tl"]
+    else:
+        bakiye_has = bakiye_usd = bakiye_eur = bakiye_tl = 0.0
 
     out = []
     for tx in transactions:
-        islem_turu = tx.get("islem_turu", "")
-        gram = float(tx.get("gram", 0) or 0)
-        ayar = tx.get("ayar", "")
-        doviz = (tx.get("iscilik_doviz") or "").strip().upper()
-        i = float(tx.get("birim_fiyat_veya_nakit", 0) or 0)
+        sign, is_gram_op = _islem_k(tx["islem_turu"] or "")
+        gram = float(tx["gram"] or 0)
+        i = float(tx["birim_fiyat_veya_nakit"] or 0)
+        doviz = (tx["iscilik_doviz"] or "").strip().upper()
 
-        has = gram * ayar_katsayi(ayar) * sign_has_gram(islem_turu)
+        has = gram * _ayar_k(tx["ayar"] or "") * sign
         bakiye_has += has
 
         # Satış/Alış: gram * i ; Ödeme/Tahsilat: i
-        if (islem_turu or "").strip().lower() in ("satış", "satis", "alış", "alis"):
-            iscilik_tutar = sign_iscilik_tutar(islem_turu) * gram * i
-        else:
-            iscilik_tutar = sign_iscilik_tutar(islem_turu) * i
+        iscilik_tutar = sign * (gram * i if is_gram_op else i)
 
         if doviz == "USD":
             bakiye_usd += iscilik_tutar
@@ -202,14 +241,23 @@ def compute_running(transactions: list[dict]) -> list[dict]:
         elif doviz == "TL":
             bakiye_tl += iscilik_tutar
 
-        row = dict(tx)
-        row["iscilik_tutar"] = iscilik_tutar
-        row["has_gram"] = has
-        row["bakiye_has"] = bakiye_has
-        row["bakiye_usd"] = bakiye_usd
-        row["bakiye_eur"] = bakiye_eur
-        row["bakiye_tl"] = bakiye_tl
-        out.append(row)
+        # Sadece ekranda/PDF'te kullanılan kolonlar; sayısal kolonların hepsi float
+        out.append({
+            "id": tx["id"],
+            "tarih": tx["tarih"],
+            "aciklama": tx["aciklama"],
+            "islem_turu": tx["islem_turu"],
+            "ayar": tx["ayar"],
+            "gram": gram,
+            "iscilik_doviz": tx["iscilik_doviz"],
+            "birim_fiyat_veya_nakit": i,
+            "iscilik_tutar": iscilik_tutar,
+            "has_gram": has,
+            "bakiye_has": bakiye_has,
+            "bakiye_usd": bakiye_usd,
+            "bakiye_eur": bakiye_eur,
+            "bakiye_tl": bakiye_tl,
+        })
 
     return out
 
@@ -217,6 +265,18 @@ def compute_running(transactions: list[dict]) -> list[dict]:
 # =========================
 # PDF
 # =========================
+def _pdf_row_cells(tx: dict) -> list[tuple]:
+    # tx: compute_running çıktısı -> [(x, metin, sağa_hizalı)]
+    return [
+        (40, str(tx["tarih"]), False),
+        (100, str(tx["islem_turu"])[:10], False),
+        (170, str(tx["ayar"])[:6], False),
+        (260, f"{tx['gram']:.3f}", True),
+        (280, str(tx["iscilik_doviz"])[:3], False),
+        (380, f"{tx['iscilik_tutar']:.2f}", True),
+        (500, f"{tx['bakiye_has']:.3f}", True),
+    ]
+
 def export_statement_pdf(pdf_path: str, musteri: str, computed_rows: list[dict]):
     c = canvas.Canvas(pdf_path, pagesize=A4)
     w, h = A4
@@ -246,21 +306,30 @@ def export_statement_pdf(pdf_path: str, musteri: str, computed_rows: list[dict])
     c.line(40, y, w - 40, y)
     y -= 14
 
-    c.setFont("Helvetica", 8)
-    for tx in computed_rows[-55:]:
+    font, size = "Helvetica", 8
+
+    # Satır metinleri ve x konumları çizimden önce hazırlanır
+    lines = [
+        [(x - c.stringWidth(s, font, size) if right else x, s) for x, s, right in _pdf_row_cells(tx)]
+        for tx in computed_rows
+    ]
+
+    # Satırlar tek bir text object içinde yazılır (sayfa başına tek BT/ET bloğu)
+    text = c.beginText()
+    text.setFont(font, size)
+    for cells in lines:
         if y < 60:
+            c.drawText(text)
             c.showPage()
             y = h - 50
-            c.setFont("Helvetica", 8)
-
-        c.drawString(40, y, str(tx.get("tarih", "")))
-        c.drawString(100, y, str(tx.get("islem_turu", ""))[:10])
-        c.drawString(170, y, str(tx.get("ayar", ""))[:6])
-        c.drawRightString(260, y, f"{float(tx.get('gram', 0) or 0):.3f}")
-        c.drawString(280, y, str(tx.get("iscilik_doviz", ""))[:3])
-        c.drawRightString(380, y, f"{float(tx.get('iscilik_tutar', 0) or 0):.2f}")
-        c.drawRightString(500, y, f"{float(tx.get('bakiye_has', 0) or 0):.3f}")
+            text = c.beginText()
+            text.setFont(font, size)
+
+        for x, s in cells:
+            text.setTextOrigin(x, y)
+            text.textOut(s)
         y -= 12
+    c.drawText(text)
 
     c.save()
 
@@ -269,26 +338,42 @@ def export_statement_pdf(pdf_path: str, musteri: str, computed_rows: list[dict])
 # UI (Tkinter)
 # =========================
 class App(tk.Tk):
+    # Treeview'e aynı anda en fazla bu kadar satır konur; gerisi kaydırdıkça yüklenir
+    _WINDOW = 200
+    # Hesaplanmış satırları tutulan müşteri sayısı (seçili müşteri + son bakılanlar)
+    _CACHE_SIZE = 4
+
     def __init__(self):
         super().__init__()
         self.title("Cari Takip (Excel -> Uygulama)")
         self.geometry("1100x650")
 
         db_init()
+        self._cache = OrderedDict()  # musteri -> (kayıt sayısı, compute_running çıktısı), LRU
+        self._all_rows = []        # seçili müşterinin tüm satırları (model)
+        self._win_start = 0        # Treeview'deki ilk satırın _all_rows içindeki indeksi
+        self._selected_id = None   # seçili kaydın iid'si (= str(id)); pencere değişince geri seçilir
+        self._current_musteri = None   # Treeview'de şu an gösterilen müşteri
+        self._dirty_customers = set()  # son gösterimden beri kaydı değişen müşteriler
 
         top = ttk.Frame(self)
         top.pack(fill="x", padx=10, pady=8)
 
-        ttk.Button(top, text="Excel İçe Aktar", command=self.import_excel).pack(side="left")
+        self.btn_import = ttk.Button(top, text="Excel İçe Aktar", command=self.import_excel)
+        self.btn_import.pack(side="left")
         ttk.Button(top, text="PDF Ekstre", command=self.export_pdf).pack(side="left", padx=6)
+        # import sürerken gösterilir
+        self.progress = ttk.Progressbar(top, mode="indeterminate", length=120)
 
         ttk.Label(top, text="Müşteri:").pack(side="left", padx=(20, 6))
         self.customer = ttk.Combobox(top, values=db_list_customers(), width=35, state="readonly")
         self.customer.pack(side="left")
         self.customer.bind("<<ComboboxSelected>>", lambda e: self.refresh())
 
-        ttk.Button(top, text="Yeni Kayıt", command=self.add_dialog).pack(side="right")
-        ttk.Button(top, text="Seçili Kaydı Sil", command=self.delete_selected).pack(side="right", padx=6)
+        self.btn_add = ttk.Button(top, text="Yeni Kayıt", command=self.add_dialog)
+        self.btn_add.pack(side="right")
+        self.btn_delete = ttk.Button(top, text="Seçili Kaydı Sil", command=self.delete_selected)
+        self.btn_delete.pack(side="right", padx=6)
 
         summary = ttk.LabelFrame(self, text="Son Durum")
         summary.pack(fill="x", padx=10, pady=(0, 8))
@@ -296,17 +381,29 @@ class App(tk.Tk):
         self.lbl_summary.pack(anchor="w", padx=10, pady=6)
 
         cols = ("id","tarih","aciklama","islem_turu","ayar","gram","doviz","birim_fiyat","iscilik_tutar","has_bakiye","usd","eur","tl")
-        self.tree = ttk.Treeview(self, columns=cols, show="headings", height=22)
-        self.tree.pack(fill="both", expand=True, padx=10, pady=10)
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True, padx=10, pady=10)
+        self.tree = ttk.Treeview(body, columns=cols, show="headings", height=22)
+        # Scrollbar tüm listeyi temsil eder, Treeview sadece bir pencereyi tutar
+        self.vsb = ttk.Scrollbar(body, orient="vertical", command=self._on_scroll)
+        self.vsb.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.configure(yscrollcommand=self._on_tree_yview)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        # Klavye ile gezinme de pencere sınırında sanal listeye devam etsin
+        for key in ("<Down>", "<Up>", "<Next>", "<Prior>", "<Home>", "<End>"):
+            self.tree.bind(key, self._on_key)
 
         headings = {
             "id":"ID","tarih":"Tarih","aciklama":"Açıklama","islem_turu":"İşlem Türü","ayar":"Ayar",
             "gram":"Gram","doviz":"Döviz","birim_fiyat":"Birim Fiyat/Nakit","iscilik_tutar":"İşçilik Tutar",
             "has_bakiye":"Has Bakiye","usd":"USD B.","eur":"EUR B.","tl":"TL B."
         }
+        widths = {c: 280 if c == "aciklama" else 95 for c in cols}
         for c in cols:
-            self.tree.heading(c, text=headings.get(c, c))
-            self.tree.column(c, width=95 if c != "aciklama" else 280, anchor="w")
+            self.tree.heading(c, text=headings[c])
+            self.tree.column(c, width=widths[c], anchor="w")
 
         self.tree.tag_configure("mavi", background="#d7eaff")     # Satış/Ödeme
         self.tree.tag_configure("kirmizi", background="#ffd6d6")  # Tahsilat/Alış
@@ -320,15 +417,49 @@ class App(tk.Tk):
         path = filedialog.askopenfilename(title="Excel seç", filetypes=[("Excel", "*.xlsx")])
         if not path:
             return
+
+        # Okuma + yazma arka planda; sonuç after() ile Tk thread'ine döner
+        # Yazan butonlar da kapatılır: worker yazma kilidini tutarken kayıt ekleme/silme bloklanır
+        for btn in (self.btn_import, self.btn_add, self.btn_delete):
+            btn.config(state="disabled")
+        self.progress.pack(side="left", padx=6, after=self.btn_import)
+        self.progress.start(10)
+
+        def worker():
+            try:
+                rows = import_from_excel(path)
+                if rows:
+                    # WAL sayesinde arayüz okumaya devam edebilir
+                    con = db_open()
+                    try:
+                        db_insert_many(rows, con)
+                    finally:
+                        con.close()
+            except Exception as e:
+                self.after(0, self._import_done, None, str(e))
+            else:
+                self.after(0, self._import_done, rows, None)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _import_done(self, rows, error):
+        self.progress.stop()
+        self.progress.pack_forget()
+        for btn in (self.btn_import, self.btn_add, self.btn_delete):
+            btn.config(state="normal")
+        if error is not None:
+            messagebox.showerror("Hata", error)
+            return
+        if not rows:
+            messagebox.showwarning("Uyarı", "Excel'de import edilecek kayıt bulunamadı.")
+            return
         try:
-            rows = import_from_excel(path)
-            if not rows:
-                messagebox.showwarning("Uyarı", "Excel'de import edilecek kayıt bulunamadı.")
-                return
-            db_insert_many(rows)
-            self.customer["values"] = db_list_customers()
-            if not self.customer.get().strip():
-                self.customer.set(db_list_customers()[0])
+            for m in {r["musteri"] for r in rows}:
+                self._invalidate(m)
+            customers = db_list_customers()
+            self.customer["values"] = customers
+            if not self.customer.get().strip() and customers:
+                self.customer.set(customers[0])
             self.refresh()
             messagebox.showinfo("Tamam", f"{len(rows)} kayıt içe aktarıldı.")
         except Exception as e:
@@ -338,41 +469,179 @@ class App(tk.Tk):
         musteri = self.customer.get().strip()
         if not musteri:
             return
+        # Aynı müşteri tekrar seçildi ve arada değişiklik yok: ekran zaten güncel
+        if musteri == self._current_musteri and musteri not in self._dirty_customers:
+            return
 
-        tx_rows = db_get_transactions(musteri)
-        computed = compute_running(tx_rows)
-
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        for tx in computed:
-            islem = (tx.get("islem_turu") or "").lower().strip()
-            tag = ""
-            if islem in ("tahsilat", "alış", "alis"):
-                tag = "kirmizi"
-            if islem in ("satış", "satis", "ödeme", "odeme"):
-                tag = "mavi"
-
-            self.tree.insert(
-                "", "end",
-                values=(
-                    tx["id"],
-                    tx.get("tarih",""),
-                    tx.get("aciklama",""),
-                    tx.get("islem_turu",""),
-                    tx.get("ayar",""),
-                    float(tx.get("gram",0) or 0),
-                    (tx.get("iscilik_doviz") or ""),
-                    float(tx.get("birim_fiyat_veya_nakit",0) or 0),
-                    float(tx.get("iscilik_tutar",0) or 0),
-                    float(tx.get("bakiye_has",0) or 0),
-                    float(tx.get("bakiye_usd",0) or 0),
-                    float(tx.get("bakiye_eur",0) or 0),
-                    float(tx.get("bakiye_tl",0) or 0),
-                ),
-                tags=(tag,)
-            )
+        computed = self._computed(musteri)
+        self._current_musteri = musteri
+        self._dirty_customers.discard(musteri)
+        self._all_rows = computed
+        self._render_window(0)
+
+        self._update_summary(computed)
+
+    def _invalidate(self, musteri: str):
+        self._cache.pop(musteri, None)
+        self._dirty_customers.add(musteri)
+
+    def _computed(self, musteri: str) -> list[dict]:
+        # Kayıt sayısı değişmediyse önceki hesaplamayı kullan
+        cnt = db_count_transactions(musteri)
+        cached = self._cache.get(musteri)
+        if cached is not None and cached[0] == cnt:
+            self._cache.move_to_end(musteri)
+            return cached[1]
+        computed = compute_running(db_get_transactions(musteri))
+        self._cache_put(musteri, cnt, computed)
+        return computed
+
+    def _cache_put(self, musteri: str, cnt: int, computed: list[dict]):
+        # Sınırlı LRU: bellek tüm tablo kadar büyümesin, en eski müşteri atılır
+        self._cache[musteri] = (cnt, computed)
+        self._cache.move_to_end(musteri)
+        while len(self._cache) > self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _render_window(self, start: int):
+        # Sadece _all_rows[start:start+_WINDOW] Treeview'e konur
+        n = len(self._all_rows)
+        start = max(0, min(start, n - self._WINDOW))
+        self._win_start = start
+
+        # Satır verilerini önce hazırla, sonra tek seferde sil + sıkı döngüde ekle
+        items = [
+            (self._tree_values(tx), (self._row_tag(tx),))
+            for tx in self._all_rows[start:start + self._WINDOW]
+        ]
+        tree = self.tree
+        sel = tree.selection()
+        if sel:
+            self._selected_id = sel[0]
+        elif self._selected_id is not None and tree.exists(self._selected_id):
+            self._selected_id = None  # görünürdeydi ama seçim kaldırılmış
+        tree.delete(*tree.get_children())
+        # iid = kayıt id'si: pencere değişse de aynı satır aynı iid ile gelir
+        for tx, (values, tags) in zip(self._all_rows[start:start + self._WINDOW], items):
+            tree.insert("", "end", iid=str(tx["id"]), values=values, tags=tags)
+        if self._selected_id is not None and tree.exists(self._selected_id):
+            tree.selection_set(self._selected_id)
+            tree.focus(self._selected_id)
+
+    def _visible_rows(self) -> int:
+        first, last = self.tree.yview()
+        return max(1, int(round((last - first) * len(self.tree.get_children()))))
+
+    def _top_row(self) -> int:
+        # Görünen ilk satırın _all_rows içindeki indeksi
+        return self._win_start + int(round(self.tree.yview()[0] * len(self.tree.get_children())))
+
+    def _scroll_to(self, row: int):
+        n = len(self._all_rows)
+        if not n:
+            return
+        visible = self._visible_rows()
+        row = max(0, min(row, n - visible))
+        shown = len(self.tree.get_children())
+        if row < self._win_start or row + visible > self._win_start + shown:
+            # Hedef pencerenin dışında: hedef ortada kalacak şekilde yeni pencere yükle
+            self._render_window(row - (self._WINDOW - visible) // 2)
+            shown = len(self.tree.get_children())
+        self.tree.yview_moveto((row - self._win_start) / shown)
+
+    def _on_scroll(self, *args):
+        # Scrollbar komutu: ("moveto", f) veya ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._all_rows)))
+        else:
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._visible_rows()
+            self._scroll_to(self._top_row() + step)
+
+    def _select_row(self, k: int):
+        # k: _all_rows indeksi; gerekirse pencereyi kaydırıp satırı seç ve göster
+        shown = len(self.tree.get_children())
+        if k < self._win_start:
+            self._scroll_to(k)
+        elif k >= self._win_start + shown:
+            self._scroll_to(k - self._visible_rows() + 1)
+        iid = str(self._all_rows[k]["id"])
+        self.tree.selection_set(iid)
+        self.tree.focus(iid)
+        self.tree.see(iid)
+
+    def _on_key(self, event):
+        n = len(self._all_rows)
+        if not n:
+            return None
+        if event.keysym in ("Next", "Prior"):
+            self._on_scroll("scroll", 1 if event.keysym == "Next" else -1, "pages")
+            return "break"
+        if event.keysym == "Home":
+            self._select_row(0)
+            return "break"
+        if event.keysym == "End":
+            self._select_row(n - 1)
+            return "break"
+        # Up/Down: pencere içindeyse Treeview'in kendi davranışı yeterli
+        focus = self.tree.focus()
+        if not focus:
+            return None
+        k = self._win_start + self.tree.index(focus) + (1 if event.keysym == "Down" else -1)
+        shown = len(self.tree.get_children())
+        if 0 <= k < n and not (self._win_start <= k < self._win_start + shown):
+            self._select_row(k)
+            return "break"
+        return None
+
+    def _on_wheel(self, event):
+        step = -3 if (event.num == 4 or event.delta > 0) else 3
+        self._scroll_to(self._top_row() + step)
+        return "break"
+
+    def _on_tree_yview(self, first, last):
+        # Pencere içi kesirleri tüm listeye göre çevirip scrollbar'a yansıt
+        n = len(self._all_rows)
+        if not n:
+            self.vsb.set(0.0, 1.0)
+            return
+        shown = len(self.tree.get_children())
+        self.vsb.set(
+            (self._win_start + float(first) * shown) / n,
+            (self._win_start + float(last) * shown) / n,
+        )
+
+    @staticmethod
+    def _row_tag(tx: dict) -> str:
+        islem = (tx["islem_turu"] or "").lower().strip()
+        tag = ""
+        if islem in ("tahsilat", "alış", "alis"):
+            tag = "kirmizi"
+        if islem in ("satış", "satis", "ödeme", "odeme"):
+            tag = "mavi"
+        return tag
+
+    @staticmethod
+    def _tree_values(tx: dict) -> tuple:
+        # tx: compute_running çıktısı; sayısal kolonlar zaten float
+        return (
+            tx["id"],
+            tx["tarih"],
+            tx["aciklama"],
+            tx["islem_turu"],
+            tx["ayar"],
+            tx["gram"],
+            tx["iscilik_doviz"] or "",
+            tx["birim_fiyat_veya_nakit"],
+            tx["iscilik_tutar"],
+            tx["bakiye_has"],
+            tx["bakiye_usd"],
+            tx["bakiye_eur"],
+            tx["bakiye_tl"],
+        )
 
+    def _update_summary(self, computed: list[dict]):
         if computed:
             last = computed[-1]
             self.lbl_summary.config(
@@ -385,6 +654,35 @@ class App(tk.Tk):
         else:
             self.lbl_summary.config(text="Kayıt yok.")
 
+    def _append_row(self, musteri: str, tx: dict) -> bool:
+        # Yeni kayıt listenin sonuna düşüyorsa sadece o satırı hesapla/ekle (O(1)).
+        # Aksi halde False döner, çağıran tam refresh yapar.
+        cnt, cached = self._cache.get(musteri, (0, None))
+        if not cached or musteri != self.customer.get().strip():
+            return False
+        last = cached[-1]
+        if tx["tarih"] < last["tarih"]:
+            return False
+        # DB'ye yazılan haliyle hesapla (ör. boş döviz -> None), yeniden yüklenen satırla aynı olsun
+        stored = dict(zip(_INSERT_COLS, _insert_params(tx)), id=tx["id"])
+        row = compute_running([stored], start=last)[0]
+        cached.append(row)
+        self._cache_put(musteri, cnt + 1, cached)
+        shown = len(self.tree.get_children())
+        if self._win_start + shown == len(cached) - 1:
+            # Pencere listenin sonunu gösteriyor: yeni satırı pencereye al ve görünür yap
+            if shown < self._WINDOW:
+                self.tree.insert(
+                    "", "end", iid=str(row["id"]), values=self._tree_values(row), tags=(self._row_tag(row),)
+                )
+            else:
+                self._render_window(self._win_start + 1)
+            self.tree.see(self.tree.get_children()[-1])
+        else:
+            self._on_tree_yview(*self.tree.yview())
+        self._update_summary(cached)
+        return True
+
     def add_dialog(self):
         musteri = self.customer.get().strip()
         if not musteri:
@@ -394,6 +692,10 @@ class App(tk.Tk):
         win = tk.Toplevel(self)
         win.title("Yeni Kayıt")
         win.geometry("450x380")
+        # Modal: dialog açıkken Excel import başlatılamaz (worker yazarken kayıt eklemek DB kilidine takılır)
+        win.transient(self)
+        win.wait_visibility()
+        win.grab_set()
 
         def row(label, r):
             ttk.Label(win, text=label).grid(row=r, column=0, sticky="w", padx=10, pady=6)
@@ -438,7 +740,7 @@ class App(tk.Tk):
                 gram = float(e_gram.get().strip().replace(",", "."))
                 tutar = float(e_i.get().strip().replace(",", "."))
 
-                db_add_transaction({
+                tx = {
                     "tarih": e_tarih.get().strip(),
                     "musteri": musteri,
                     "aciklama": e_acik.get().strip(),
@@ -448,9 +750,12 @@ class App(tk.Tk):
                     "birim": "gr",
                     "iscilik_doviz": e_doviz.get().strip(),
                     "birim_fiyat_veya_nakit": tutar,
-                })
+                }
+                tx["id"] = db_add_transaction(tx)
                 win.destroy()
-                self.refresh()
+                if not self._append_row(musteri, tx):
+                    self._invalidate(musteri)
+                    self.refresh()
             except Exception as e:
                 messagebox.showerror("Hata", str(e))
 
@@ -463,13 +768,14 @@ class App(tk.Tk):
         tx_id = int(self.tree.item(sel[0])["values"][0])
         if messagebox.askyesno("Sil", f"ID {tx_id} kaydı silinsin mi?"):
             db_delete_transaction(tx_id)
+            self._invalidate(self.customer.get().strip())
             self.refresh()
 
     def export_pdf(self):
         musteri = self.customer.get().strip()
         if not musteri:
             return
-        computed = compute_running(db_get_transactions(musteri))
+        computed = self._computed(musteri)
 
         path = filedialog.asksaveasfilename(
             title="PDF kaydet",